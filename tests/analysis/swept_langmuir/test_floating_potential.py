@@ -3,6 +3,8 @@
 `plasmapy.analysis.swept_langmuir.floating_potential`.
 """
 
+import functools
+from types import SimpleNamespace
 from unittest import mock
 
 import numpy as np
@@ -17,6 +19,19 @@
 )
 from plasmapy.utils.exceptions import PlasmaPyWarning
 
+_V4 = np.array([1.0, 2, 3, 4])
+_C4 = np.array([-1.0, 0, 1, 2])
+_LINEAR = ffuncs.Linear()
+
+_NULL_RESULT_DICT = {
+    "vf": np.nan,
+    "vf_err": np.nan,
+    "rsq": None,
+    "fitted_func": None,
+    "islands": None,
+    "fitted_indices": None,
+}
+
 
 def test_floating_potential_namedtuple() -> None:
     """
@@ -43,23 +58,46 @@ class TestFindFloatingPotential:
     `~plasmapy.analysis.swept_langmuir.floating_potential.find_floating_potential`.
     """
 
-    _null_result = {
-        **VFExtras(
-            vf_err=np.nan, rsq=None, fitted_func=None, islands=None, fitted_indices=None
-        )._asdict(),
-        "vf": np.nan,
-    }
+    @pytest.fixture(scope="class")
+    def sweeps(self) -> SimpleNamespace:
+        """
+        Voltage and current sweeps used throughout the tests.  Tests are
+        parametrized on the current attribute name (e.g. ``"linear"``) to
+        keep the arrays out of pytest's parametrization table.
+        """
+        voltage = np.linspace(-10.0, 15, 70)
+        linear = np.linspace(-3.1, 4.1, 70)
+        return SimpleNamespace(
+            voltage=voltage,
+            linear=linear,
+            linear_p_sine=linear + 1.2 * np.sin(1.2 * voltage),
+            exponential=-1.3 + 2.2 * np.exp(voltage),
+        )
+
+    @pytest.fixture(scope="class")
+    def cached_ffp(self, sweeps):
+        """
+        Memoized `find_floating_potential` on the ``sweeps`` fixture, keyed
+        on the name of the current sweep so repeated parameter sets are only
+        fitted once.
+        """
+
+        @functools.lru_cache(maxsize=32)
+        def _cached_ffp(current, min_points, fit_type):
+            return find_floating_potential(
+                sweeps.voltage,
+                getattr(sweeps, current),
+                min_points=min_points,
+                fit_type=fit_type,
+            )
 
-    _voltage = np.linspace(-10.0, 15, 70)
-    _linear_current = np.linspace(-3.1, 4.1, 70)
-    _linear_p_sine_current = _linear_current + 1.2 * np.sin(1.2 * _voltage)
-    _exp_current = -1.3 + 2.2 * np.exp(_voltage)
+        return _cached_ffp
 
     def test_alias(self) -> None:
         """Test the associated alias(es) is(are) defined correctly."""
         assert find_vf_ is find_floating_potential
 
-    def test_call_of_check_sweep(self) -> None:
+    def test_call_of_check_sweep(self, monkeypatch) -> None:
         """
         Test `find_floating_potential` appropriately calls
         `plasmapy.analysis.swept_langmuir.helpers.check_sweep` so we can relay on
@@ -70,19 +108,19 @@ def test_call_of_check_sweep(self) -> None:
 
         assert sla.helpers.check_sweep is sla.floating_potential.check_sweep
 
-        with mock.patch(f"{sla.floating_potential.__name__}.check_sweep") as mock_cs:
-            mock_cs.return_value = varr, carr
-            find_floating_potential(voltage=varr, current=carr, fit_type="linear")
+        mock_cs = mock.MagicMock(return_value=(varr, carr))
+        monkeypatch.setattr(sla.floating_potential, "check_sweep", mock_cs)
+        find_floating_potential(voltage=varr, current=carr, fit_type="linear")
 
-            assert mock_cs.call_count == 1
+        assert mock_cs.call_count == 1
 
-            # passed args
-            assert len(mock_cs.call_args[0]) == 2
-            assert np.array_equal(mock_cs.call_args[0][0], varr)
-            assert np.array_equal(mock_cs.call_args[0][1], carr)
+        # passed args
+        assert len(mock_cs.call_args[0]) == 2
+        assert np.array_equal(mock_cs.call_args[0][0], varr)
+        assert np.array_equal(mock_cs.call_args[0][1], carr)
 
-            # passed kwargs
-            assert mock_cs.call_args[1] == {"strip_units": True}
+        # passed kwargs
+        assert mock_cs.call_args[1] == {"strip_units": True}
 
     @pytest.mark.parametrize(
         ("kwargs", "_error"),
@@ -90,8 +128,8 @@ def test_call_of_check_sweep(self) -> None:
             # errors on kwarg fit_type
             (
                 {
-                    "voltage": np.array([1.0, 2, 3, 4]),
-                    "current": np.array([-1.0, 0, 1, 2]),
+                    "voltage": _V4,
+                    "current": _C4,
                     "fit_type": "wrong",
                 },
                 ValueError,
@@ -100,24 +138,24 @@ def test_call_of_check_sweep(self) -> None:
             # errors on kwarg min_points
             (
                 {
-                    "voltage": np.array([1.0, 2, 3, 4]),
-                    "current": np.array([-1.0, 0, 1, 2]),
+                    "voltage": _V4,
+                    "current": _C4,
                     "min_points": "wrong",
                 },
                 TypeError,
             ),
             (
                 {
-                    "voltage": np.array([1.0, 2, 3, 4]),
-                    "current": np.array([-1.0, 0, 1, 2]),
+                    "voltage": _V4,
+                    "current": _C4,
                     "min_points": -1,
                 },
                 ValueError,
             ),
             (
                 {
-                    "voltage": np.array([1.0, 2, 3, 4]),
-                    "current": np.array([-1.0, 0, 1, 2]),
+                    "voltage": _V4,
+                    "current": _C4,
                     "min_points": 0,
                 },
                 ValueError,
@@ -126,16 +164,16 @@ def test_call_of_check_sweep(self) -> None:
             # errors on kwarg threshold
             (
                 {
-                    "voltage": np.array([1.0, 2, 3, 4]),
-                    "current": np.array([-1.0, 0, 1, 2]),
+                    "voltage": _V4,
+                    "current": _C4,
                     "threshold": -1,
                 },
                 ValueError,
             ),
             (
                 {
-                    "voltage": np.array([1.0, 2, 3, 4]),
-                    "current": np.array([-1.0, 0, 1, 2]),
+                    "voltage": _V4,
+                    "current": _C4,
                     "threshold": "wrong type",
                 },
                 TypeError,
@@ -145,7 +183,7 @@ def test_call_of_check_sweep(self) -> None:
             (
                 {
                     "voltage": "not an array",
-                    "current": np.array([-1.0, 0, 1, 2]),
+                    "current": _C4,
                     "fit_type": "linear",
                 },
                 TypeError,
@@ -156,7 +194,7 @@ def test_call_of_check_sweep(self) -> None:
             (
                 {
                     "voltage": np.array([2.0, 1, 0, -1]),
-                    "current": np.array([-1.0, 0, 1, 2]),
+                    "current": _C4,
                     "fit_type": "linear",
                 },
                 ValueError,
@@ -169,18 +207,15 @@ def test_raises(self, kwargs, _error) -> None:
             find_floating_potential(**kwargs)
 
     @pytest.mark.parametrize(
-        ("kwargs", "expected", "_warning"),
+        ("current", "kwargs", "expected", "_warning"),
         [
             # too many crossing islands
             (
+                "linear_p_sine",
+                {"fit_type": "linear"},
                 {
-                    "voltage": _voltage,
-                    "current": _linear_p_sine_current,
-                    "fit_type": "linear",
-                },
-                {
-                    **_null_result,
-                    "fitted_func": ffuncs.Linear(),
+                    **_NULL_RESULT_DICT,
+                    "fitted_func": _LINEAR,
                     "islands": [slice(27, 29), slice(36, 38), slice(39, 41)],
                 },
                 PlasmaPyWarning,
@@ -188,19 +223,18 @@ def test_raises(self, kwargs, _error) -> None:
             #
             # min_points is larger than array size
             (
+                "linear_p_sine",
                 {
-                    "voltage": _voltage,
-                    "current": _linear_p_sine_current,
                     "fit_type": "linear",
                     "threshold": 8,
                     "min_points": 80,
                 },
                 {
-                    **_null_result,
+                    **_NULL_RESULT_DICT,
                     "vf": 0.6355491,
                     "vf_err": 0.03306472,
                     "rsq": 0.8446441,
-                    "fitted_func": ffuncs.Linear(),
+                    "fitted_func": _LINEAR,
                     "islands": [slice(27, 41)],
                     "fitted_indices": slice(0, 70),
                 },
@@ -208,25 +242,31 @@ def test_raises(self, kwargs, _error) -> None:
             ),
         ],
     )
-    def test_warnings(self, kwargs, expected, _warning) -> None:
+    def test_warnings(self, sweeps, current, kwargs, expected, _warning) -> None:
         """Test scenarios that issue warnings."""
         with pytest.warns(_warning):
-            vf, extras = find_floating_potential(**kwargs)
+            vf, extras = find_floating_potential(
+                sweeps.voltage, getattr(sweeps, current), **kwargs
+            )
             assert isinstance(extras, VFExtras)
 
-        for key, val in expected.items():
-            rtn_val = vf if key == "vf" else getattr(extras, key)
-            if val is None:
-                assert rtn_val is None
-            elif key == "fitted_func":
-                assert isinstance(rtn_val, val.__class__)
-            elif np.isscalar(val):
-                if np.isnan(val):
-                    assert np.isnan(rtn_val)
-                else:
-                    assert np.isclose(rtn_val, val)
-            else:
-                assert rtn_val == val
+        results = {"vf": vf, **extras._asdict()}
+
+        # compare all scalar values in a single call
+        scalar_keys = ("vf", "vf_err", "rsq")
+        for key in scalar_keys:
+            assert (results[key] is None) == (expected[key] is None)
+        exp_arr = np.array([expected[key] for key in scalar_keys], dtype=float)
+        rtn_arr = np.array([results[key] for key in scalar_keys], dtype=float)
+        np.testing.assert_allclose(rtn_arr, exp_arr, rtol=1e-5, equal_nan=True)
+
+        if expected["fitted_func"] is None:
+            assert results["fitted_func"] is None
+        else:
+            assert isinstance(results["fitted_func"], type(expected["fitted_func"]))
+
+        for key in ("islands", "fitted_indices"):
+            assert results[key] == expected[key]
 
     @pytest.mark.parametrize(
         ("min_points", "fit_type", "islands", "indices"),
@@ -244,41 +284,37 @@ def test_warnings(self, kwargs, expected, _warning) -> None:
             (None, "exponential", [slice(26, 28)], slice(20, 34)),
         ],
     )
-    def test_kwarg_min_points(self, min_points, fit_type, islands, indices) -> None:
+    def test_kwarg_min_points(
+        self, cached_ffp, min_points, fit_type, islands, indices
+    ) -> None:
         """
         Test functionality of keyword `min_points` and how it affects the
         size of the crossing-point island.
         """
-        voltage = self._voltage
-        current = self._linear_current if fit_type == "linear" else self._exp_current
-        vf, extras = find_floating_potential(
-            voltage,
-            current,
-            min_points=min_points,
-            fit_type=fit_type,
-        )
+        current = "linear" if fit_type == "linear" else "exponential"
+        vf, extras = cached_ffp(current, min_points, fit_type)
         assert isinstance(extras, VFExtras)
 
         assert extras.islands == islands
         assert extras.fitted_indices == indices
 
     @pytest.mark.parametrize(
-        ("kwargs", "expected"),
+        ("current", "offset", "kwargs", "expected"),
         [
             # simple linear
             (
+                "linear",
+                0.0,
                 {
-                    "voltage": _voltage,
-                    "current": _linear_current,
                     "fit_type": "linear",
                     "min_points": 16,
                 },
                 {
-                    **_null_result,
+                    **_NULL_RESULT_DICT,
                     "vf": 0.7638889,
                     "vf_err": 0.0,
                     "rsq": 1.0,
-                    "fitted_func": ffuncs.Linear(),
+                    "fitted_func": _LINEAR,
                     "islands": [slice(29, 31)],
                     "fitted_indices": slice(22, 38),
                 },
@@ -286,18 +322,18 @@ def test_kwarg_min_points(self, min_points, fit_type, islands, indices) -> None:
             #
             # multiple islands merged with min_points
             (
+                "linear_p_sine",
+                0.0,
                 {
-                    "voltage": _voltage,
-                    "current": _linear_p_sine_current,
                     "fit_type": "linear",
                     "min_points": 16,
                 },
                 {
-                    **_null_result,
+                    **_NULL_RESULT_DICT,
                     "vf": -8.8243208,
                     "vf_err": 032.9961,
                     "rsq": 0.005084178,
-                    "fitted_func": ffuncs.Linear(),
+                    "fitted_func": _LINEAR,
                     "islands": [slice(27, 29), slice(36, 38), slice(39, 41)],
                     "fitted_indices": slice(26, 42),
                 },
@@ -305,18 +341,18 @@ def test_kwarg_min_points(self, min_points, fit_type, islands, indices) -> None:
             #
             # crossing-point near front of the array
             (
+                "linear",
+                2.5,
                 {
-                    "voltage": _voltage,
-                    "current": _linear_current + 2.5,
                     "fit_type": "linear",
                     "min_points": 16,
                 },
                 {
-                    **_null_result,
+                    **_NULL_RESULT_DICT,
                     "vf": -7.91666667,
                     "vf_err": 3.153378e-8,
                     "rsq": 1.0,
-                    "fitted_func": ffuncs.Linear(),
+                    "fitted_func": _LINEAR,
                     "islands": [slice(5, 7)],
                     "fitted_indices": slice(0, 16),
                 },
@@ -324,29 +360,31 @@ def test_kwarg_min_points(self, min_points, fit_type, islands, indices) -> None:
             #
             # crossing-point near end of the array
             (
+                "linear",
+                -4.0,
                 {
-                    "voltage": _voltage,
-                    "current": _linear_current - 4.0,
                     "fit_type": "linear",
                     "min_points": 16,
                 },
                 {
-                    **_null_result,
+                    **_NULL_RESULT_DICT,
                     "vf": 14.6527778,
                     "vf_err": 0.0,
                     "rsq": 1.0,
-                    "fitted_func": ffuncs.Linear(),
+                    "fitted_func": _LINEAR,
                     "islands": [slice(68, 70)],
                     "fitted_indices": slice(54, 70),
                 },
             ),
         ],
     )
-    def test_island_finding(self, kwargs, expected) -> None:
+    def test_island_finding(self, sweeps, current, offset, kwargs, expected) -> None:
         """
         Test scenarios related to the identification of crossing-point islands.
         """
-        vf, extras = find_floating_potential(**kwargs)
+        vf, extras = find_floating_potential(
+            sweeps.voltage, getattr(sweeps, current) + offset, **kwargs
+        )
         assert isinstance(extras, VFExtras)
 
         for key, val in expected.items():
@@ -364,9 +402,9 @@ def test_island_finding(self, kwargs, expected) -> None:
                 assert rtn_val == val
 
     @pytest.mark.parametrize(("m", "b"), [(2.0, 0.0), (1.33, -0.1), (0.5, -0.1)])
-    def test_perfect_linear(self, m, b) -> None:
+    def test_perfect_linear(self, sweeps, m, b) -> None:
         """Test calculated fit parameters on a few perfectly linear cases."""
-        voltage = self._voltage
+        voltage = sweeps.voltage
         current = m * voltage + b
 
         vf, extras = find_floating_potential(
@@ -388,9 +426,11 @@ def test_perfect_linear(self, m, b) -> None:
         ("a", "alpha", "b"),
         [(1.0, 0.2, -0.2), (2.7, 0.2, -10.0), (6.0, 0.6, -10.0)],
     )
-    def test_perfect_exponential(self, a: float, alpha: float, b: float) -> None:
+    def test_perfect_exponential(
+        self, sweeps, a: float, alpha: float, b: float
+    ) -> None:
         """Test calculated fit parameters on a few perfectly exponential cases."""
-        voltage = self._voltage
+        voltage = sweeps.voltage
         current = a * np.exp(alpha * voltage) + b
 
         vf, extras = find_floating_potential(